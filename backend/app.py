@@ -5,47 +5,185 @@ This is the entry point for Hugging Face Spaces deployment.
 It provides API endpoints for time-slot-based form status checking.
 """
 
+import time
+import asyncio
+import itertools
 import gradio as gr
+import orjson
 from fastapi import FastAPI, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
 import uvicorn
-from datetime import datetime
-from main import check_form_for_slot, TIME_SLOTS, FORM_URL, FORM_TITLE, IST
-
-
-# Global tracking
-check_stats = {slot_id: {'checks': 0, 'last_status': None} for slot_id in TIME_SLOTS}
+from form_check import create_async_client, check_form_status_async
+from main import check_form_for_slot, is_within_time_slot, outside_slot_result, active_slot_result, TIME_SLOTS, ALL_SLOTS_MD, active_slots, FORM_URL, FORM_TITLE, now_ist
+
+
+# Global tracking - next() on itertools.count is a single atomic C call,
+# so concurrent requests can't lose increments
+check_counters = {slot_id: itertools.count(1) for slot_id in TIME_SLOTS}
+last_status = {slot_id: None for slot_id in TIME_SLOTS}
+
+# Shared async HTTP client, created on app startup
+_CLIENT = None
+
+# Latest form status, refreshed in the background while a slot is active so
+# API requests read a snapshot instead of each fetching the form.
+# The dict is a form_check result plus 'last_checked_at' (ISO time).
+POLL_INTERVAL = 30.0
+MAX_POLL_BACKOFF = 300.0
+# Snapshots older than this are refreshed on demand (e.g. right as a slot starts)
+FORM_STATE_MAX_AGE = 2 * POLL_INTERVAL
+# Error/unknown snapshots expire much sooner, so a transient failure isn't
+# served for long while the poller backs off
+ERROR_STATE_MAX_AGE = 5.0
+_FORM_STATE = None
+_FORM_STATE_AT = 0.0  # time.monotonic() of the snapshot
+_FORM_STATE_LOCK = asyncio.Lock()
+_POLL_TASK = None
+
+# Rendered JSON bodies for inactive slots, keyed by (slot_id, message).
+# There are only a couple of distinct messages per slot.
+_OUTSIDE_BODIES = {}
+# The answer stays "outside_slot" for a while, let clients/CDNs reuse it
+_OUTSIDE_HEADERS = {'Cache-Control': 'public, max-age=60'}
+
+# Static tail of the "Current Status" panel
+_CURRENT_INFO_TAIL = "\n\n---\n\n### All Slots:\n" + ALL_SLOTS_MD
+
+# Pre-serialized bodies for /api/slots and /api/health. Only the trailing
+# current_time changes, so each response is prefix + timestamp + b'"}'.
+# (TIME_SLOTS never changes at runtime.)
+_SLOTS_PREFIX = orjson.dumps({
+    'slots': {k: {'label': v.label, 'day': v.day} for k, v in TIME_SLOTS.items()},
+})[:-1] + b',"current_time":"'
+_HEALTH_PREFIX = orjson.dumps({'status': 'healthy'})[:-1] + b',"current_time":"'
+
+
+def _invalid_slot_result() -> dict:
+    """Response body for a missing or unknown slot_id."""
+    return {
+        'error': True,
+        'message': f'Invalid slot_id. Valid options: {list(TIME_SLOTS.keys())}',
+        'is_open': None,
+        'status': 'error'
+    }
+
+
+def _record_check(slot_id: str, status: str):
+    """Update stats for a slot check."""
+    next(check_counters[slot_id])
+    last_status[slot_id] = status
+
+
+def _outside_slot_response(slot_id: str, slot_check: dict) -> Response:
+    """Cacheable response for a slot that is not currently active."""
+    key = (slot_id, slot_check['message'])
+    body = _OUTSIDE_BODIES.get(key)
+    if body is None:
+        body = orjson.dumps(outside_slot_result(slot_id, slot_check))
+        _OUTSIDE_BODIES[key] = body
+    return Response(content=body, media_type="application/json", headers=_OUTSIDE_HEADERS)
+
+
+def _timestamped_response(prefix: bytes) -> Response:
+    """JSON response from a pre-serialized prefix plus the current time."""
+    return Response(content=prefix + now_ist().iso.encode() + b'"}', media_type="application/json")
+
+
+def _fresh_form_state():
+    """Return the form status snapshot if it is recent enough, else None."""
+    if _FORM_STATE is None:
+        return None
+    max_age = FORM_STATE_MAX_AGE if _FORM_STATE['status'] in ('open', 'closed') else ERROR_STATE_MAX_AGE
+    if time.monotonic() - _FORM_STATE_AT < max_age:
+        return _FORM_STATE
+    return None
+
+
+async def _refresh_form_state() -> bool:
+    """
+    Fetch the form and update the snapshot. Must hold _FORM_STATE_LOCK.
+    
+    A failed check doesn't replace a recent open/closed snapshot, and is
+    only kept for ERROR_STATE_MAX_AGE.
+    
+    Returns:
+        bool: True if the form status was determined
+    """
+    global _FORM_STATE, _FORM_STATE_AT
+    result = await check_form_status_async(_CLIENT)
+    ok = result['status'] in ('open', 'closed')
+    if ok or _fresh_form_state() is None:
+        _FORM_STATE = {**result, 'last_checked_at': now_ist().iso}
+        _FORM_STATE_AT = time.monotonic()
+    return ok
+
+
+async def _get_form_state() -> dict:
+    """Get the form status snapshot, refreshing it first if it is stale."""
+    state = _fresh_form_state()
+    if state is None:
+        async with _FORM_STATE_LOCK:
+            # The poller or another request may have refreshed it meanwhile
+            state = _fresh_form_state()
+            if state is None:
+                await _refresh_form_state()
+                state = _FORM_STATE
+    return state
+
+
+async def _poll_form_state():
+    """Keep the form status snapshot fresh while a slot is active."""
+    delay = POLL_INTERVAL
+    while True:
+        try:
+            if active_slots(now_ist()):
+                async with _FORM_STATE_LOCK:
+                    ok = await _refresh_form_state()
+                # Back off while the form can't be checked
+                delay = POLL_INTERVAL if ok else min(delay * 2, MAX_POLL_BACKOFF)
+            else:
+                delay = POLL_INTERVAL
+        except Exception as e:
+            print(f"[APP] Form status poll failed: {e}")
+            delay = min(delay * 2, MAX_POLL_BACKOFF)
+        await asyncio.sleep(delay)
 
 
 def api_check_slot(slot_id: str) -> dict:
     """
-    API endpoint to check form status for a specific slot.
-    This is the main API that the Flutter app will call.
+    Check form status for a specific slot using the blocking sync path.
+    Used by the Gradio UI callbacks, which run in Gradio's threadpool;
+    /api/status answers from the async form status snapshot instead.
     """
     if not slot_id or slot_id not in TIME_SLOTS:
-        return {
-            'error': True,
-            'message': f'Invalid slot_id. Valid options: {list(TIME_SLOTS.keys())}',
-            'is_open': None,
-            'status': 'error'
-        }
+        return _invalid_slot_result()
     
     result = check_form_for_slot(slot_id)
-    
-    # Update stats
-    check_stats[slot_id]['checks'] += 1
-    check_stats[slot_id]['last_status'] = result['status']
+    _record_check(slot_id, result['status'])
     
     return result
 
 
+async def _active_slot_status(slot_id: str) -> dict:
+    """
+    Status of a slot that is currently active, answered from the
+    background-polled form status snapshot so the event loop isn't blocked
+    on a form fetch. Inactive slots are handled by get_status.
+    """
+    state = await _get_form_state()
+    result = active_slot_result(slot_id, state)
+    result['last_checked_at'] = state['last_checked_at']
+    return result
+
+
 def format_slot_status(slot_id: str) -> str:
     """Format slot status for Gradio display."""
     if not slot_id:
         return "Please select a time slot."
     
     result = api_check_slot(slot_id)
-    timestamp = datetime.now(IST).strftime("%Y-%m-%d %H:%M:%S")
+    now = now_ist()
+    timestamp = f"{now.date_str} {now.time_str}"
     
     status_emoji = "✅" if result.get('is_open') else "❌" if result.get('is_open') is False else "⏸️"
     
@@ -54,9 +192,9 @@ def format_slot_status(slot_id: str) -> str:
 
 **Timestamp:** {timestamp}
 
-**Slot:** {slot_id} ({TIME_SLOTS.get(slot_id, {}).get('label', 'Unknown')})
+**Slot:** {slot_id} ({getattr(TIME_SLOTS.get(slot_id), 'label', 'Unknown')})
 
-**Day:** {TIME_SLOTS.get(slot_id, {}).get('day', 'Unknown')}
+**Day:** {getattr(TIME_SLOTS.get(slot_id), 'day', 'Unknown')}
 
 ---
 
@@ -75,45 +213,30 @@ def format_slot_status(slot_id: str) -> str:
 
 def get_current_info() -> str:
     """Get current time and active slot information."""
-    now = datetime.now(IST)  # Use IST timezone
-    current_day = now.strftime('%A')
-    current_time = now.strftime('%H:%M:%S')
+    now = now_ist()
     
-    active_slots = []
-    for slot_id, slot_info in TIME_SLOTS.items():
-        if now.weekday() == slot_info['day_number']:
-            if slot_info['start'] <= now.time() <= slot_info['end']:
-                active_slots.append(f"{slot_id} ({slot_info['label']})")
+    active_md = "".join(
+        f"\n✅ **{slot_id} ({slot_info.label})**"
+        for slot_id, slot_info in active_slots(now)
+    ) or "\n⏸️ No slots are currently active."
     
-    output = f"""
+    return f"""
 ## Current Status
 
-**Date:** {now.strftime('%Y-%m-%d')}
+**Date:** {now.date_str}
 
-**Day:** {current_day}
+**Day:** {now.day_name}
 
-**Time:** {current_time}
+**Time:** {now.time_str}
 
 ---
 
 ### Active Slots Right Now:
-"""
-    
-    if active_slots:
-        for slot in active_slots:
-            output += f"\n✅ **{slot}**"
-    else:
-        output += "\n⏸️ No slots are currently active."
-    
-    output += "\n\n---\n\n### All Slots:\n"
-    for slot_id, slot_info in TIME_SLOTS.items():
-        output += f"\n- **{slot_id}**: {slot_info['label']} ({slot_info['day']})"
-    
-    return output
+{active_md}{_CURRENT_INFO_TAIL}"""
 
 
 # Create Gradio Interface
-with gr.Blocks(title="APTI Attendance - Form Checker", theme=gr.themes.Soft()) as demo:
+with gr.Blocks(title="APTI Attendance - Form Checker", theme=gr.themes.Soft(), analytics_enabled=False) as demo:
     gr.Markdown("""
     # 📋 APTI Attendance - Google Form Status Checker
     
@@ -164,45 +287,83 @@ with gr.Blocks(title="APTI Attendance - Form Checker", theme=gr.themes.Soft()) a
 
 
 # Create FastAPI app and mount Gradio
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+
+@app.on_event("startup")
+async def start_form_polling():
+    """Create the shared HTTP client and start polling the form status."""
+    global _CLIENT, _POLL_TASK
+    _CLIENT = create_async_client()
+    _POLL_TASK = asyncio.create_task(_poll_form_state())
 
 
-@app.get("/api/status")
+@app.on_event("shutdown")
+async def stop_form_polling():
+    """Stop polling and close the shared HTTP client."""
+    if _POLL_TASK is not None:
+        _POLL_TASK.cancel()
+        # Let it finish unwinding so it can't use the client after it's closed
+        try:
+            await _POLL_TASK
+        except asyncio.CancelledError:
+            pass
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+
+
+@app.get("/api/status", include_in_schema=False)
 async def get_status(slot: str = Query(None, description="Time slot ID")):
     """API endpoint for checking form status"""
     if not slot:
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             'error': True,
             'message': 'Missing slot parameter. Use ?slot=tue_930',
             'available_slots': list(TIME_SLOTS.keys()),
-            'current_time': datetime.now(IST).isoformat()
+            'current_time': now_ist().iso
         })
     
-    result = api_check_slot(slot)
-    return JSONResponse(content=result)
+    if slot not in TIME_SLOTS:
+        return ORJSONResponse(content=_invalid_slot_result())
+    
+    # Most of the week no slot is active - answer without touching the form
+    slot_check = is_within_time_slot(slot)
+    if not slot_check['is_active']:
+        _record_check(slot, 'outside_slot')
+        return _outside_slot_response(slot, slot_check)
+    
+    result = await _active_slot_status(slot)
+    _record_check(slot, result['status'])
+    # Returning the response directly skips FastAPI's jsonable_encoder pass
+    return ORJSONResponse(content=result)
 
 
-@app.get("/api/slots")
+@app.get("/api/slots", include_in_schema=False)
 async def get_slots():
     """Get all available slots"""
-    return JSONResponse(content={
-        'slots': {k: {'label': v['label'], 'day': v['day']} for k, v in TIME_SLOTS.items()},
-        'current_time': datetime.now(IST).isoformat()
-    })
+    return _timestamped_response(_SLOTS_PREFIX)
 
 
-@app.get("/api/health")
+@app.get("/api/health", include_in_schema=False)
 async def health_check():
     """Health check endpoint"""
-    return JSONResponse(content={
-        'status': 'healthy',
-        'current_time': datetime.now(IST).isoformat()
-    })
+    return _timestamped_response(_HEALTH_PREFIX)
+
+
+@app.get("/", include_in_schema=False)
+async def root():
+    """Send browsers to the Gradio UI"""
+    return RedirectResponse(url="/ui")
 
 
-# Mount Gradio app
-app = gr.mount_gradio_app(app, demo, path="/")
+# Mount Gradio app on its own path, after the API routes, so API requests
+# are dispatched without going through Gradio
+app = gr.mount_gradio_app(app, demo, path="/ui")
 
 
 if __name__ == "__main__":
+    # uvicorn[standard] installs uvloop and httptools, which uvicorn's "auto"
+    # defaults pick up where available. Keep a single worker: Gradio's queue
+    # and sessions live in process memory, and each worker would run its own
+    # form poller.
     uvicorn.run(app, host="0.0.0.0", port=7860)
@@ -6,52 +6,136 @@ by scraping the form page and looking for specific text indicators.
 """
 
 import os
-import requests
-from bs4 import BeautifulSoup
-from dotenv import load_dotenv
+import html
+import time
+import threading
+import httpx
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from a local .env file, if there is one.
+# Deployments (e.g. Hugging Face Spaces) inject them directly.
+_ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+if os.path.exists(_ENV_FILE):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(_ENV_FILE)
+    except ImportError:
+        pass
 
-# Configuration - loaded from .env file with defaults
+# Configuration - loaded from the environment (or .env file) with defaults
 FORM_URL = os.getenv("FORM_URL", "https://forms.gle/dK7QEXzTw8ZoGKsV6")
 FORM_TITLE = os.getenv("FORM_TITLE", "APTITUDE CLASS ATTENDANCE 2027 BATCH")
 CLOSED_MESSAGE = "is no longer accepting responses"
 
+# Byte patterns searched for in the raw page. The title may be served
+# HTML-escaped (e.g. '&' as '&amp;'), so match either form.
+CLOSED_BYTES = CLOSED_MESSAGE.encode()
+TITLE_BYTES = tuple({FORM_TITLE.encode(), html.escape(FORM_TITLE, quote=False).encode()})
 
-def check_form_status(url: str = FORM_URL) -> dict:
+# Size of the chunks the form page is streamed in
+CHUNK_SIZE = 16384
+
+# Headers to mimic a browser request
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+# Connection settings shared by the sync and async clients. Connections to
+# forms.gle and docs.google.com (redirect target) are kept alive and
+# multiplexed over HTTP/2; httpx negotiates gzip (and br when brotli is
+# installed) and decompresses transparently.
+LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+TIMEOUT = httpx.Timeout(10.0, connect=3.05)
+RETRIES = 2  # connection failures only
+
+# Shared HTTP client for check_form_status
+_CLIENT = httpx.Client(
+    headers=HEADERS,
+    timeout=TIMEOUT,
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(http2=True, limits=LIMITS, retries=RETRIES),
+)
+
+# Short-lived cache of conclusive results, keyed by URL: {url: (fetched_at, result)}
+CACHE_TTL = 45.0
+_CACHE = {}
+# Coalesce concurrent cache misses in check_form_status into a single upstream request
+_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached(url: str):
+    """Return the cached result for url if it is still fresh, else None."""
+    entry = _CACHE.get(url)
+    if entry is not None and time.monotonic() - entry[0] < CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _store_cached(url: str, result: dict):
+    """Cache a result, unless it is an error/unknown that should be retried."""
+    if result['status'] in ('open', 'closed'):
+        # Timestamp after the fetch so the entry isn't pre-aged by slow requests
+        _CACHE[url] = (time.monotonic(), result)
+
+
+def create_async_client() -> httpx.AsyncClient:
     """
-    Check if the Google Form is open or closed.
+    Create the shared async HTTP client used by check_form_status_async.
     
-    Args:
-        url: The Google Form URL to check
-        
-    Returns:
-        dict with keys:
-            - 'is_open': bool - True if form is accepting responses, False otherwise
-            - 'status': str - 'open', 'closed', or 'error'
-            - 'message': str - Descriptive message about the form status
+    The caller owns the client and must close it with `await client.aclose()`.
     """
-    try:
-        # Set headers to mimic a browser request
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        }
-        
-        # Make the request
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Parse the HTML content
-        soup = BeautifulSoup(response.text, 'html.parser')
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=TIMEOUT,
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=LIMITS, retries=RETRIES),
+    )
+
+
+class _PageScanner:
+    """
+    Scans the form page chunk by chunk as it streams in.
+    
+    Both indicators appear verbatim in the raw HTML, so a plain substring
+    search is enough - no need to build a DOM, or even keep the whole page.
+    Only the last few bytes of each chunk are carried over, to catch matches
+    that span a chunk boundary.
+    """
+    
+    _OVERLAP = max(len(needle) for needle in (CLOSED_BYTES, *TITLE_BYTES)) - 1
+    
+    def __init__(self):
+        self.closed = False
+        self.title_seen = False
+        self._tail = b""
+    
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Scan the next chunk of the page.
         
-        # Get the full page text for analysis
-        page_text = soup.get_text()
+        Returns True once the closed message has been seen, meaning the rest
+        of the page doesn't need to be downloaded. Seeing the title is not
+        enough to stop early, since closed forms show the title too.
+        """
+        data = self._tail + chunk
+        if CLOSED_BYTES in data:
+            self.closed = True
+            return True
+        if not self.title_seen:
+            self.title_seen = any(title in data for title in TITLE_BYTES)
+        self._tail = data[-self._OVERLAP:]
+        return False
+    
+    def result(self) -> dict:
+        """
+        Work out the form status from what was seen.
         
+        Returns:
+            dict in the same format as check_form_status
+        """
         # Check if the closed message is present
-        if CLOSED_MESSAGE in page_text:
+        if self.closed:
             return {
                 'is_open': False,
                 'status': 'closed',
@@ -59,7 +143,7 @@ def check_form_status(url: str = FORM_URL) -> dict:
             }
         
         # Check if the form title is present (indicates form loaded successfully)
-        if FORM_TITLE in page_text:
+        if self.title_seen:
             return {
                 'is_open': True,
                 'status': 'open',
@@ -72,14 +156,110 @@ def check_form_status(url: str = FORM_URL) -> dict:
             'status': 'unknown',
             'message': "Could not determine form status. The form page loaded but expected content was not found."
         }
+
+
+def check_form_status(url: str = FORM_URL) -> dict:
+    """
+    Check if the Google Form is open or closed.
+    
+    Open/closed results are cached for CACHE_TTL seconds.
+    
+    Args:
+        url: The Google Form URL to check
+        
+    Returns:
+        dict with keys:
+            - 'is_open': bool - True if form is accepting responses, False otherwise
+            - 'status': str - 'open', 'closed', or 'error'
+            - 'message': str - Descriptive message about the form status
+    """
+    result = _get_cached(url)
+    if result is not None:
+        return result
+    
+    with _CACHE_LOCK:
+        # Another thread may have fetched while we waited
+        result = _get_cached(url)
+        if result is None:
+            result = _fetch_form_status(url)
+            _store_cached(url, result)
+    return result
+
+
+def _fetch_form_status(url: str) -> dict:
+    """Fetch the form page and check its status, bypassing the cache."""
+    try:
+        scanner = _PageScanner()
+        
+        # Stream the page so we can stop early
+        with _CLIENT.stream("GET", url) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes(CHUNK_SIZE):
+                if scanner.feed(chunk):
+                    break
+        
+        return scanner.result()
+        
+    except httpx.TimeoutException:
+        return {
+            'is_open': None,
+            'status': 'error',
+            'message': "Request timed out. Please check your internet connection."
+        }
+    except httpx.HTTPError as e:
+        return {
+            'is_open': None,
+            'status': 'error',
+            'message': f"Failed to fetch the form page: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            'is_open': None,
+            'status': 'error',
+            'message': f"An unexpected error occurred: {str(e)}"
+        }
+
+
+async def check_form_status_async(client: httpx.AsyncClient, url: str = FORM_URL) -> dict:
+    """
+    Async version of check_form_status for use inside the event loop.
+    
+    Always fetches the page - callers coalesce and reuse results themselves
+    (see app._get_form_state). Open/closed results are still stored in the
+    cache that check_form_status reads.
+    
+    Args:
+        client: Shared client from create_async_client()
+        url: The Google Form URL to check
+        
+    Returns:
+        dict in the same format as check_form_status
+    """
+    result = await _fetch_form_status_async(client, url)
+    _store_cached(url, result)
+    return result
+
+
+async def _fetch_form_status_async(client: httpx.AsyncClient, url: str) -> dict:
+    """Async version of _fetch_form_status."""
+    try:
+        scanner = _PageScanner()
+        
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                if scanner.feed(chunk):
+                    break
+        
+        return scanner.result()
         
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         return {
             'is_open': None,
             'status': 'error',
             'message': "Request timed out. Please check your internet connection."
         }
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {
             'is_open': None,
             'status': 'error',
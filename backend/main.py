@@ -5,45 +5,122 @@ This module serves as the main entry point for the attendance tracking system.
 It checks if the Google Form is open based on time slots.
 """
 
+import time as _time
+from collections import namedtuple
+from dataclasses import asdict, dataclass
 from datetime import datetime, time, timezone, timedelta
 from form_check import check_form_status, FORM_URL, FORM_TITLE
 
 # IST Timezone (UTC+5:30)
 IST = timezone(timedelta(hours=5, minutes=30))
 
+# Current IST time, broken down into the pieces the app needs
+NowIST = namedtuple('NowIST', ['weekday', 'time', 'date_str', 'time_str', 'day_name', 'iso'])
+
+# (computed_at, NowIST) - shared by calls within the same second
+_NOW_CACHE = (0.0, None)
+
+
+def now_ist() -> NowIST:
+    """
+    Get the current IST time, cached for up to one second so bursts of
+    requests share the datetime/strftime work.
+    """
+    global _NOW_CACHE
+    ts, cached = _NOW_CACHE
+    mono = _time.monotonic()
+    if cached is not None and mono - ts < 1.0:
+        return cached
+    
+    now = datetime.now(IST)
+    cached = NowIST(
+        weekday=now.weekday(),
+        time=now.time(),
+        date_str=now.strftime('%Y-%m-%d'),
+        time_str=now.strftime('%H:%M:%S'),
+        day_name=now.strftime('%A'),
+        iso=now.isoformat(),
+    )
+    _NOW_CACHE = (mono, cached)
+    return cached
+
+
+@dataclass(frozen=True, slots=True)
+class Slot:
+    """A weekly class slot during which the form is checked."""
+    label: str
+    day: str
+    day_number: int  # 0=Monday, 1=Tuesday, ... 4=Friday
+    start: time
+    end: time
+
 
 # Time Slots Configuration
 # Each slot has: id, day (0=Monday, 1=Tuesday, ... 4=Friday), start_time, end_time
 TIME_SLOTS = {
-    'tue_930': {
-        'label': '9:30 - 11:10 AM',
-        'day': 'Tuesday',
-        'day_number': 1,  # Tuesday
-        'start': time(9, 25),   # 5 min buffer before
-        'end': time(11, 15),    # 5 min buffer after
-    },
-    'fri_1110': {
-        'label': '11:10 AM - 12:50 PM',
-        'day': 'Friday',
-        'day_number': 4,  # Friday
-        'start': time(11, 5),
-        'end': time(12, 55),
-    },
-    'tue_140': {
-        'label': '1:40 - 3:20 PM',
-        'day': 'Tuesday',
-        'day_number': 1,  # Tuesday
-        'start': time(13, 35),
-        'end': time(15, 25),
-    },
-    'tue_1110': {
-        'label': '11:10 AM - 12:50 PM',
-        'day': 'Tuesday',
-        'day_number': 1,  # Tuesday
-        'start': time(11, 5),
-        'end': time(12, 55),
-    },
+    'tue_930': Slot(
+        label='9:30 - 11:10 AM',
+        day='Tuesday',
+        day_number=1,  # Tuesday
+        start=time(9, 25),   # 5 min buffer before
+        end=time(11, 15),    # 5 min buffer after
+    ),
+    'fri_1110': Slot(
+        label='11:10 AM - 12:50 PM',
+        day='Friday',
+        day_number=4,  # Friday
+        start=time(11, 5),
+        end=time(12, 55),
+    ),
+    'tue_140': Slot(
+        label='1:40 - 3:20 PM',
+        day='Tuesday',
+        day_number=1,  # Tuesday
+        start=time(13, 35),
+        end=time(15, 25),
+    ),
+    'tue_1110': Slot(
+        label='11:10 AM - 12:50 PM',
+        day='Tuesday',
+        day_number=1,  # Tuesday
+        start=time(11, 5),
+        end=time(12, 55),
+    ),
+}
+
+# Precomputed lookups for the hot path
+# slot_id -> (day_number, start, end, slot)
+_SLOT_INDEX = {
+    slot_id: (slot.day_number, slot.start, slot.end, slot)
+    for slot_id, slot in TIME_SLOTS.items()
 }
+# Slots grouped by weekday (Monday=0): [(slot_id, start, end, slot), ...]
+_SLOTS_BY_DAY = [[] for _ in range(7)]
+for _slot_id, (_day_number, _start, _end, _slot) in _SLOT_INDEX.items():
+    _SLOTS_BY_DAY[_day_number].append((_slot_id, _start, _end, _slot))
+
+# Markdown list of all slots - static, so rendered once
+ALL_SLOTS_MD = "".join(
+    f"\n- **{slot_id}**: {slot.label} ({slot.day})"
+    for slot_id, slot in TIME_SLOTS.items()
+)
+
+
+def active_slots(now: NowIST) -> list:
+    """
+    Get the slots whose window contains the given time.
+    
+    Args:
+        now: Current time from now_ist()
+        
+    Returns:
+        list of (slot_id, Slot) pairs, in TIME_SLOTS order
+    """
+    return [
+        (slot_id, slot)
+        for slot_id, start, end, slot in _SLOTS_BY_DAY[now.weekday]
+        if start <= now.time <= end
+    ]
 
 
 def is_within_time_slot(slot_id: str) -> dict:
@@ -56,44 +133,69 @@ def is_within_time_slot(slot_id: str) -> dict:
     Returns:
         dict with:
             - 'is_active': bool - True if current time is within slot
-            - 'slot_info': dict - Information about the slot
+            - 'slot_info': Slot - Information about the slot
             - 'message': str - Description of status
     """
-    if slot_id not in TIME_SLOTS:
+    entry = _SLOT_INDEX.get(slot_id)
+    if entry is None:
         return {
             'is_active': False,
             'slot_info': None,
             'message': f"Unknown slot ID: {slot_id}"
         }
     
-    slot = TIME_SLOTS[slot_id]
-    now = datetime.now(IST)  # Use IST timezone
-    current_day = now.weekday()  # Monday=0, Sunday=6
-    current_time = now.time()
+    day_number, start, end, slot = entry
+    now = now_ist()
     
-    # Check if correct day
-    if current_day != slot['day_number']:
+    # Check if correct day (Monday=0, Sunday=6)
+    if now.weekday != day_number:
         return {
             'is_active': False,
             'slot_info': slot,
-            'message': f"Today is not {slot['day']}. Slot '{slot['label']}' only active on {slot['day']}."
+            'message': f"Today is not {slot.day}. Slot '{slot.label}' only active on {slot.day}."
         }
     
     # Check if within time window
-    if slot['start'] <= current_time <= slot['end']:
+    if start <= now.time <= end:
         return {
             'is_active': True,
             'slot_info': slot,
-            'message': f"Slot '{slot['label']}' is currently active."
+            'message': f"Slot '{slot.label}' is currently active."
         }
     else:
         return {
             'is_active': False,
             'slot_info': slot,
-            'message': f"Current time is outside slot window ({slot['label']})."
+            'message': f"Current time is outside slot window ({slot.label})."
         }
 
 
+def outside_slot_result(slot_id: str, slot_check: dict) -> dict:
+    """Build the check_form_for_slot result for a slot that is not active."""
+    return {
+        'is_open': None,
+        'status': 'outside_slot',
+        'message': slot_check['message'],
+        'slot_id': slot_id,
+        'slot_active': False,
+        'form_url': FORM_URL,
+        'form_title': FORM_TITLE,
+    }
+
+
+def active_slot_result(slot_id: str, form_result: dict) -> dict:
+    """Build the check_form_for_slot result from a form check."""
+    return {
+        'is_open': form_result['is_open'],
+        'status': form_result['status'],
+        'message': form_result['message'],
+        'slot_id': slot_id,
+        'slot_active': True,
+        'form_url': FORM_URL,
+        'form_title': FORM_TITLE,
+    }
+
+
 def check_form_for_slot(slot_id: str) -> dict:
     """
     Check if the Google Form is open for a specific time slot.
@@ -114,29 +216,13 @@ def check_form_for_slot(slot_id: str) -> dict:
     slot_check = is_within_time_slot(slot_id)
     
     if not slot_check['is_active']:
-        return {
-            'is_open': None,
-            'status': 'outside_slot',
-            'message': slot_check['message'],
-            'slot_id': slot_id,
-            'slot_active': False,
-            'form_url': FORM_URL,
-            'form_title': FORM_TITLE,
-        }
+        return outside_slot_result(slot_id, slot_check)
     
     # We're within the slot window - actually check the form
     print(f"[MAIN] Slot {slot_id} is active - checking form...")
     form_result = check_form_status()
     
-    return {
-        'is_open': form_result['is_open'],
-        'status': form_result['status'],
-        'message': form_result['message'],
-        'slot_id': slot_id,
-        'slot_active': True,
-        'form_url': FORM_URL,
-        'form_title': FORM_TITLE,
-    }
+    return active_slot_result(slot_id, form_result)
 
 
 def main(slot_id: str = None) -> dict:
@@ -155,7 +241,7 @@ def main(slot_id: str = None) -> dict:
             'status': 'info',
             'message': 'No slot specified. Available slots listed.',
             'available_slots': list(TIME_SLOTS.keys()),
-            'slots_detail': {k: {'label': v['label'], 'day': v['day']} 
+            'slots_detail': {k: {'label': v.label, 'day': v.day} 
                            for k, v in TIME_SLOTS.items()}
         }
     
@@ -182,7 +268,7 @@ def get_all_slots() -> dict:
         dict: All slot information
     """
     return {
-        'slots': TIME_SLOTS,
+        'slots': {slot_id: asdict(slot) for slot_id, slot in TIME_SLOTS.items()},
         'current_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         'current_day': datetime.now().strftime('%A'),
     }
@@ -209,6 +295,6 @@ if __name__ == "__main__":
         print("\nAvailable Time Slots:")
         print("-" * 50)
         for slot_id, slot_info in TIME_SLOTS.items():
-            print(f"  {slot_id}: {slot_info['label']} ({slot_info['day']})")
+            print(f"  {slot_id}: {slot_info.label} ({slot_info.day})")
         print("\nUsage: python main.py <slot_id>")
         print("Example: python main.py tue_930")